@@ -17,7 +17,7 @@ __all__ = [
 
 import base64
 from datetime import datetime
-from functools import partial
+import gzip
 import http.client
 from io import BytesIO
 import json
@@ -29,8 +29,10 @@ import time
 from django.conf import settings
 from django.core.exceptions import PermissionDenied
 from django.db.models import Q
+from django.db.models.functions import Collate
 from django.http import HttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils.cache import patch_vary_headers
 from formencode.validators import Int, Number, String
 from piston3.utils import rc
 import yaml
@@ -1181,17 +1183,46 @@ class CommissioningScriptsHandler(MetadataViewHandler):
     This endpoint is deprecated in favor of MAASScriptsHandler below.
     """
 
+    # Directory within the archive holding the scripts.
+    ARCHIVE_PREFIX = "commissioning.d"
+
+    # The most recently produced archive, as a (key, archives) tuple, where
+    # archives maps a content encoding (None for none) to the archive
+    # encoded with it. See `_get_archive_key` for how the key is computed.
+    _archive_cache = (None, {})
+
+    def _get_archive_key(self):
+        """Return a key identifying the current set of commissioning scripts.
+
+        A script's content is an immutable `VersionedTextFile`, and changing
+        it makes a new one, so the scripts' ids, names and content ids pin
+        down the archive exactly. Timestamps would not: `updated` is set on
+        save, so a change committed after a later one could go unnoticed.
+        """
+        return tuple(
+            Script.objects.filter(script_type=SCRIPT_TYPE.COMMISSIONING)
+            .order_by("id")
+            .values_list("id", "name", "script_id")
+        )
+
     def _iter_scripts(self):
-        for script in Script.objects.filter(
-            script_type=SCRIPT_TYPE.COMMISSIONING
-        ):
+        # Only fetch the columns needed, joining in the script content rather
+        # than fetching each VersionedTextFile separately. Names are compared
+        # bytewise, as Python would sort them, whatever the database's
+        # collation.
+        scripts = (
+            Script.objects.filter(script_type=SCRIPT_TYPE.COMMISSIONING)
+            .order_by(Collate("name", "C"))
+            .values_list("name", "script__data")
+        )
+        for name, data in scripts.iterator():
             try:
                 # Check if the script is a base64 encoded binary.
-                content = base64.b64decode(script.script.data)
+                content = base64.b64decode(data)
             except Exception:
                 # If it isn't encode the text as binary data.
-                content = script.script.data.encode()
-            yield script.name, content
+                content = data.encode()
+            yield name, content
 
     def _get_archive(self):
         """Produce a tar archive of all commissionig scripts.
@@ -1199,18 +1230,69 @@ class CommissioningScriptsHandler(MetadataViewHandler):
         Each of the scripts will be in the `ARCHIVE_PREFIX` directory.
         """
         binary = BytesIO()
-        scripts = sorted(self._iter_scripts())
+        mtime = time.time()
         with tarfile.open(mode="w", fileobj=binary) as tarball:
-            add_script = partial(add_file_to_tar, tarball, mtime=time.time())
-            for name, content in scripts:
-                add_script(os.path.join("commissioning.d", name), content)
+            # Scripts come out of the database sorted by name, so only one
+            # script's content needs to be held in memory at a time.
+            for name, content in self._iter_scripts():
+                add_file_to_tar(
+                    tarball, f"{self.ARCHIVE_PREFIX}/{name}", content, mtime
+                )
         return binary.getvalue()
 
+    def _get_cached_archive(self, encoding=None):
+        """Return the commissioning scripts archive, building it if needed.
+
+        The scripts rarely change, so the archive is only rebuilt when
+        `_get_archive_key` reports a change.
+
+        :param encoding: None, or "gzip" for a gzip compressed archive.
+        """
+        key = self._get_archive_key()
+        cached_key, archives = CommissioningScriptsHandler._archive_cache
+        if cached_key != key:
+            archives = {None: self._get_archive()}
+            CommissioningScriptsHandler._archive_cache = key, archives
+        if encoding == "gzip" and encoding not in archives:
+            # Scripts are mostly text and compress well even at the fastest
+            # compression level.
+            archives[encoding] = gzip.compress(archives[None], compresslevel=1)
+        return archives[encoding]
+
+    def _accepts_gzip(self, accept_encoding):
+        """Whether an `Accept-Encoding` header value accepts gzip.
+
+        gzip is accepted when it's listed without a q-value of 0.
+        """
+        for coding in accept_encoding.split(","):
+            name, *params = coding.split(";")
+            if name.strip().lower() != "gzip":
+                continue
+            for param in params:
+                key, _, value = param.partition("=")
+                if key.strip().lower() == "q":
+                    try:
+                        return float(value) > 0
+                    except ValueError:
+                        return False
+            return True
+        return False
+
     def read(self, request, version, mac=None):
         check_version(version)
-        return HttpResponse(
-            self._get_archive(), content_type="application/tar"
+        accept_encoding = request.META.get("HTTP_ACCEPT_ENCODING", "")
+        if self._accepts_gzip(accept_encoding):
+            encoding = "gzip"
+        else:
+            encoding = None
+        response = HttpResponse(
+            self._get_cached_archive(encoding),
+            content_type="application/tar",
         )
+        patch_vary_headers(response, ("Accept-Encoding",))
+        if encoding is not None:
+            response["Content-Encoding"] = encoding
+        return response
 
 
 class AnonMAASScriptsHandler(AnonymousOperationsHandler):
@@ -4,6 +4,7 @@
 """Builtin scripts commited to Script model."""
 
 import dataclasses
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
@@ -67,6 +68,21 @@ class BuiltinScript:
             return None
         return self._find_file(self.inject_file)
 
+    @cached_property
+    def content(self) -> str:
+        """The rendered script.
+
+        Scripts on disk don't change while MAAS is running, so they're only
+        read and rendered once.
+        """
+        substitutes = {"name": self.name, **self.substitutes}
+        if self.inject_file:
+            substitutes["inject_file"] = self.inject_path.read_text()
+        template = tempita.Template.from_filename(
+            self.script_path, encoding="utf-8"
+        )
+        return template.substitute(substitutes)
+
 
 BUILTIN_SCRIPTS = [
     # Commissioning scripts
@@ -201,15 +217,7 @@ BUILTIN_SCRIPTS = [
 
 def load_builtin_scripts():
     for script in BUILTIN_SCRIPTS:
-        if script.inject_file:
-            with open(script.inject_path) as f:
-                script.substitutes["inject_file"] = f.read()
-        script_content = tempita.Template.from_filename(
-            script.script_path, encoding="utf-8"
-        )
-        script_content = script_content.substitute(
-            {"name": script.name, **script.substitutes}
-        )
+        script_content = script.content
         form = None
         try:
             script_in_db = Script.objects.get(name=script.name)
@@ -361,10 +361,12 @@ def _process_system_information(node, system_data):
 
     # Set the virtual tag.
     system_type = system_data.get("type")
-    tag, _ = Tag.objects.get_or_create(name="virtual")
     if not system_type or system_type == "physical":
-        node.tags.remove(tag)
+        # Only look for the tag on the node, there's no need to create it
+        # just to make sure it isn't there.
+        node.tags.remove(*node.tags.filter(name="virtual"))
     else:
+        tag, _ = Tag.objects.get_or_create(name="virtual")
         node.tags.add(tag)
 
 
@@ -2770,6 +2770,13 @@ class TestProcessLXDResults(MAASServerTestCase):
         )
         self.assertFalse(node.tags.filter(name="virtual").exists())
 
+    def test_physical_does_not_create_virtual_tag(self):
+        node = factory.make_Node()
+        process_lxd_results(
+            node, make_lxd_output_json(virt_type="physical"), 0
+        )
+        self.assertFalse(Tag.objects.filter(name="virtual").exists())
+
     def test_syncs_pods(self):
         pod = factory.make_Pod()
         node = factory.make_Node()
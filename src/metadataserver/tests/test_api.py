@@ -4,6 +4,7 @@
 import base64
 from collections import namedtuple
 from datetime import datetime, timedelta
+import gzip
 import http.client
 from io import BytesIO
 import json
@@ -62,6 +63,7 @@ from metadataserver import api
 from metadataserver.api import (
     add_event_to_node_event_log,
     check_version,
+    CommissioningScriptsHandler,
     get_node_for_mac,
     get_node_for_request,
     get_queried_node,
@@ -2644,6 +2646,92 @@ class TestCommissioningAPI(MAASServerTestCase):
             archive.extractfile(path).read().decode("utf-8"),
         )
 
+    def test_commissioning_scripts_archive_is_cached(self):
+        self.patch(CommissioningScriptsHandler, "_archive_cache", (None, {}))
+        factory.make_Script(script_type=SCRIPT_TYPE.COMMISSIONING)
+        get_archive = self.patch(CommissioningScriptsHandler, "_get_archive")
+        get_archive.return_value = factory.make_bytes()
+        client = make_node_client()
+        url = reverse("commissioning-scripts", args=["latest"])
+        first = client.get(url)
+        second = client.get(url)
+        get_archive.assert_called_once_with()
+        self.assertEqual(get_archive.return_value, first.content)
+        self.assertEqual(get_archive.return_value, second.content)
+
+    def test_commissioning_scripts_archive_rebuilt_on_change(self):
+        self.patch(CommissioningScriptsHandler, "_archive_cache", (None, {}))
+        script = factory.make_Script(script_type=SCRIPT_TYPE.COMMISSIONING)
+        get_archive = self.patch(CommissioningScriptsHandler, "_get_archive")
+        get_archive.return_value = factory.make_bytes()
+        client = make_node_client()
+        url = reverse("commissioning-scripts", args=["latest"])
+        client.get(url)
+        factory.make_Script(script_type=SCRIPT_TYPE.COMMISSIONING)
+        client.get(url)
+        script.delete()
+        client.get(url)
+        self.assertEqual(3, get_archive.call_count)
+
+    def test_commissioning_scripts_archive_rebuilt_on_content_change(self):
+        self.patch(CommissioningScriptsHandler, "_archive_cache", (None, {}))
+        script = factory.make_Script(script_type=SCRIPT_TYPE.COMMISSIONING)
+        client = make_node_client()
+        url = reverse("commissioning-scripts", args=["latest"])
+        path = f"{CommissioningScriptsHandler.ARCHIVE_PREFIX}/{script.name}"
+
+        def get_script_from_archive():
+            response = client.get(url)
+            tar = tarfile.open(mode="r", fileobj=BytesIO(response.content))
+            return tar.extractfile(path).read()
+
+        old_content = get_script_from_archive()
+        # Swap the content without going through save(), as when another
+        # transaction's change commits late, so `updated` doesn't move.
+        new_script = script.script.update(factory.make_script_content())
+        Script.objects.filter(id=script.id).update(script=new_script)
+        self.assertNotEqual(old_content, get_script_from_archive())
+
+    def test_commissioning_scripts_archive_sorted_by_code_point(self):
+        self.patch(CommissioningScriptsHandler, "_archive_cache", (None, {}))
+        # Locale collations ignore punctuation at first, which would put
+        # "00_b" before "00-c".
+        for name in ("00_b", "00-c", "00A"):
+            factory.make_Script(
+                name=name, script_type=SCRIPT_TYPE.COMMISSIONING
+            )
+        client = make_node_client()
+        response = client.get(
+            reverse("commissioning-scripts", args=["latest"])
+        )
+        tar = tarfile.open(mode="r", fileobj=BytesIO(response.content))
+        names = tar.getnames()
+        self.assertEqual(sorted(names), names)
+
+    def test_commissioning_scripts_gzipped_when_accepted(self):
+        self.patch(CommissioningScriptsHandler, "_archive_cache", (None, {}))
+        factory.make_Script(script_type=SCRIPT_TYPE.COMMISSIONING)
+        client = make_node_client()
+        url = reverse("commissioning-scripts", args=["latest"])
+        plain = client.get(url)
+        gzipped = client.get(url, HTTP_ACCEPT_ENCODING="gzip, deflate")
+        self.assertNotIn("Content-Encoding", plain)
+        self.assertEqual("gzip", gzipped["Content-Encoding"])
+        self.assertIn("Accept-Encoding", gzipped["Vary"])
+        self.assertEqual(plain.content, gzip.decompress(gzipped.content))
+
+    def test_commissioning_scripts_not_gzipped_when_refused(self):
+        self.patch(CommissioningScriptsHandler, "_archive_cache", (None, {}))
+        factory.make_Script(script_type=SCRIPT_TYPE.COMMISSIONING)
+        client = make_node_client()
+        response = client.get(
+            reverse("commissioning-scripts", args=["latest"]),
+            HTTP_ACCEPT_ENCODING="deflate, gzip;q=0",
+        )
+        self.assertNotIn("Content-Encoding", response)
+        # Opening the archive with no compression fails if it's gzipped.
+        tarfile.open(mode="r:", fileobj=BytesIO(response.content))
+
     def test_other_user_than_node_cannot_signal_commissioning_result(self):
         node = factory.make_Node(status=NODE_STATUS.COMMISSIONING)
         client = MAASSensibleOAuthClient(factory.make_User())
@@ -41,6 +41,23 @@ AMT_ERRORS = {
 
 REQUIRED_PACKAGES = [["wsman", "wsmancli"]]
 
+# Parser for output returned by wsman. The documents come from the BMC so
+# don't resolve entities or fetch anything from the network.
+WSMAN_PARSER = etree.XMLParser(
+    resolve_entities=False, no_network=True, collect_ids=False
+)
+
+# Compiled once, as it's evaluated against every document returned by wsman.
+POWER_STATE_XPATH = etree.XPath(
+    "//h:PowerState/text()",
+    namespaces={
+        "h": (
+            "http://schemas.dmtf.org/wbem/wscim/1/cim-schema"
+            "/2/CIM_AssociatedPowerManagementService"
+        )
+    },
+)
+
 
 class AMTPowerDriver(PowerDriver):
     name = "amt"
@@ -92,19 +109,13 @@ class AMTPowerDriver(PowerDriver):
         starts = [match.start() for match in xmldecls]
         ends = starts[1:] + [len(xml)]
         frags = (xml[start:end] for start, end in zip(starts, ends))
-        return (etree.fromstring(frag) for frag in frags)
+        return (etree.fromstring(frag, WSMAN_PARSER) for frag in frags)
 
     def get_power_state(self, xml: bytes) -> str:
         """Get PowerState text from XML."""
-        namespaces = {
-            "h": (
-                "http://schemas.dmtf.org/wbem/wscim/1/cim-schema"
-                "/2/CIM_AssociatedPowerManagementService"
-            )
-        }
         state = next(
             chain.from_iterable(
-                doc.xpath("//h:PowerState/text()", namespaces=namespaces)
+                POWER_STATE_XPATH(doc)
                 for doc in self._parse_multiple_xml_docs(xml)
             )
         )
@@ -154,6 +154,20 @@ class TestAMTPowerDriver(MAASTestCase):
 
         self.assertEqual(result, "8")
 
+    def test_parse_multiple_xml_docs_does_not_resolve_entities(self):
+        amt_power_driver = AMTPowerDriver()
+        xml = dedent(
+            """\
+            <?xml version="1.0" encoding="UTF-8"?>
+            <!DOCTYPE root [<!ENTITY state "8">]>
+            <root>&state;</root>
+        """
+        ).encode("utf-8")
+
+        [doc] = amt_power_driver._parse_multiple_xml_docs(xml)
+
+        self.assertIsNone(doc.text)
+
     def test_run_runs_command(self):
         amt_power_driver = AMTPowerDriver()
         amt_power_driver.env = None
@@ -4,7 +4,7 @@
 """RPC implementation for clusters."""
 
 
-from functools import partial
+from functools import lru_cache, partial
 import json
 from operator import itemgetter
 import os
@@ -109,6 +109,16 @@ log = LegacyLogger()
 DHCP_TIMEOUT = 30  # 30 seconds.
 
 
+@lru_cache(maxsize=1)
+def get_power_types_schema():
+    """Return the schema of all power drivers.
+
+    Drivers are registered when the registry is imported and their settings
+    don't change, so the schema is only built and validated once.
+    """
+    return PowerDriverRegistry.get_schema(detect_missing_packages=False)
+
+
 def catch_probe_and_enlist_error(name, failure):
     """Logs any errors when trying to probe and enlist a chassis."""
     maaslog.error(
@@ -280,11 +290,7 @@ class Cluster(RPCProtocol):
         # Detection of missing packages is now done reactively instead of
         # proactively. When a power check is performed it will raise an error
         # if their are any missing packages.
-        return {
-            "power_types": list(
-                PowerDriverRegistry.get_schema(detect_missing_packages=False)
-            )
-        }
+        return {"power_types": list(get_power_types_schema())}
 
     @cluster.ValidateLicenseKey.responder
     def validate_license_key(self, osystem, release, key):
@@ -19,7 +19,6 @@ from twisted.internet import error, reactor, ssl
 from twisted.internet.defer import Deferred, fail, inlineCallbacks, succeed
 from twisted.internet.error import ConnectionClosed
 from twisted.internet.task import Clock
-from twisted.internet.testing import StringTransportWithDisconnection
 from twisted.protocols import amp
 from twisted.python.failure import Failure
 from twisted.python.threadable import isInIOThread
@@ -100,20 +99,33 @@ from provisioningserver.utils.twisted import (
 from provisioningserver.utils.version import get_running_version
 
 TIMEOUT = get_testing_timeout()
+twisted_test_factory = MAASTwistedRunTest.make_factory(timeout=TIMEOUT)
 
 
-class TestClusterProtocol_Identify(MAASTestCase):
-    run_tests_with = MAASTwistedRunTest.make_factory(timeout=TIMEOUT)
+class SharedClusterProtocolTestCase(MAASTestCase):
+    """Base for tests of stateless responders.
 
+    The responders keep no state between calls, so every test in a class
+    can share one `Cluster` protocol.
+    """
+
+    run_tests_with = twisted_test_factory
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.protocol = Cluster()
+
+
+class TestClusterProtocol_Identify(SharedClusterProtocolTestCase):
     def test_identify_is_registered(self):
-        protocol = Cluster()
-        responder = protocol.locateResponder(cluster.Identify.commandName)
+        responder = self.protocol.locateResponder(cluster.Identify.commandName)
         self.assertIsNotNone(responder)
 
     def test_identify_reports_system_id(self):
         system_id = factory.make_name("id")
         self.useFixture(MAASIDFixture(system_id))
-        d = call_responder(Cluster(), cluster.Identify, {})
+        d = call_responder(self.protocol, cluster.Identify, {})
 
         def check(response):
             self.assertEqual({"ident": system_id}, response)
@@ -122,7 +134,7 @@ class TestClusterProtocol_Identify(MAASTestCase):
 
 
 class TestClusterProtocol_Authenticate(MAASTestCase):
-    run_tests_with = MAASTwistedRunTest.make_factory(timeout=TIMEOUT)
+    run_tests_with = twisted_test_factory
 
     def test_authenticate_is_registered(self):
         protocol = Cluster()
@@ -145,21 +157,17 @@ class TestClusterProtocol_Authenticate(MAASTestCase):
         self.assertEqual(expected_digest, digest)
 
 
-class TestClusterProtocol_StartTLS(MAASTestCase):
-    run_tests_with = MAASTwistedRunTest.make_factory(timeout=TIMEOUT)
-
+class TestClusterProtocol_StartTLS(SharedClusterProtocolTestCase):
     def test_StartTLS_is_registered(self):
-        protocol = Cluster()
-        responder = protocol.locateResponder(amp.StartTLS.commandName)
+        responder = self.protocol.locateResponder(amp.StartTLS.commandName)
         self.assertIsNotNone(responder)
 
     def test_get_tls_parameters_returns_parameters(self):
         # get_tls_parameters() is the underlying responder function.
         # However, locateResponder() returns a closure, so we have to
         # side-step it.
-        protocol = Cluster()
-        cls, func = protocol._commandDispatch[amp.StartTLS.commandName]
-        tls_params = func(protocol)
+        cls, func = self.protocol._commandDispatch[amp.StartTLS.commandName]
+        tls_params = func(self.protocol)
         self.assertIsInstance(
             tls_params.get("tls_localCertificate"), ssl.PrivateCertificate
         )
@@ -173,7 +181,7 @@ class TestClusterProtocol_StartTLS(MAASTestCase):
         # travelling over the wire as part of an AMP message. However,
         # the responder is not aware of this, and is called just like
         # any other.
-        d = call_responder(Cluster(), amp.StartTLS, {})
+        d = call_responder(self.protocol, amp.StartTLS, {})
 
         def check(response):
             self.assertEqual({}, response)
@@ -181,12 +189,17 @@ class TestClusterProtocol_StartTLS(MAASTestCase):
         return d.addCallback(check)
 
 
-class TestClusterProtocol_DescribePowerTypes(MAASTestCase):
-    run_tests_with = MAASTwistedRunTest.make_factory(timeout=TIMEOUT)
+class TestClusterProtocol_DescribePowerTypes(SharedClusterProtocolTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Building the schema walks every power driver; do it only once.
+        cls.expected_power_types = PowerDriverRegistry.get_schema(
+            detect_missing_packages=False
+        )
 
     def test_describe_power_types_is_registered(self):
-        protocol = Cluster()
-        responder = protocol.locateResponder(
+        responder = self.protocol.locateResponder(
             cluster.DescribePowerTypes.commandName
         )
         self.assertIsNotNone(responder)
@@ -194,14 +207,21 @@ class TestClusterProtocol_DescribePowerTypes(MAASTestCase):
     @inlineCallbacks
     def test_describe_power_types_returns_jsonized_schema(self):
         response = yield call_responder(
-            Cluster(), cluster.DescribePowerTypes, {}
+            self.protocol, cluster.DescribePowerTypes, {}
         )
 
         self.assertEqual(response.keys(), {"power_types"})
-        self.assertEqual(
-            PowerDriverRegistry.get_schema(detect_missing_packages=False),
-            response["power_types"],
-        )
+        self.assertEqual(self.expected_power_types, response["power_types"])
+
+    @inlineCallbacks
+    def test_describe_power_types_builds_schema_once(self):
+        clusterservice.get_power_types_schema.cache_clear()
+        self.addCleanup(clusterservice.get_power_types_schema.cache_clear)
+        get_schema = self.patch(PowerDriverRegistry, "get_schema")
+        get_schema.return_value = []
+        yield call_responder(self.protocol, cluster.DescribePowerTypes, {})
+        yield call_responder(self.protocol, cluster.DescribePowerTypes, {})
+        get_schema.assert_called_once_with(detect_missing_packages=False)
 
 
 def make_inert_client_service(max_idle_conns=1, max_conns=1, keepalive=1):
@@ -217,7 +237,7 @@ def make_inert_client_service(max_idle_conns=1, max_conns=1, keepalive=1):
 
 
 class TestClusterClientService(MAASTestCase):
-    run_tests_with = MAASTwistedRunTest.make_factory(timeout=TIMEOUT)
+    run_tests_with = twisted_test_factory
 
     def fakeAgentResponse(self, data="", code=200):
         self.patch(clusterservice, "readBody").return_value = succeed(data)
@@ -226,6 +246,17 @@ class TestClusterClientService(MAASTestCase):
         mock_agent.request.return_value = succeed(response)
         self.patch(clusterservice, "Agent").return_value = mock_agent
 
+    def make_service_with_patched_connections(self):
+        """Return a service whose `connect`/`disconnect` are patched.
+
+        :return: A tuple of the service and the `connect` and `disconnect`
+            mocks.
+        """
+        service = ClusterClientService(Clock())
+        connect = self.patch(service.connections, "connect")
+        disconnect = self.patch(service.connections, "disconnect")
+        return service, connect, disconnect
+
     def test_init_sets_appropriate_instance_attributes(self):
         service = ClusterClientService(sentinel.reactor)
         self.assertIsInstance(service, TimerService)
@@ -691,27 +722,35 @@ class TestClusterClientService(MAASTestCase):
     # The following represents an example response from the RPC info
     # view in maasserver. Event-loops listen on ephemeral ports, and
     # it's up to the RPC info view to direct clients to them.
-    example_rpc_info_view_response = json.dumps(
-        {
-            "eventloops": {
-                # An event-loop in pid 1001 on host1. This host has two
-                # configured IP addresses, 1.1.1.1 and 1.1.1.2.
-                "host1:pid=1001": [
-                    ("::ffff:1.1.1.1", 1111),
-                    ("::ffff:1.1.1.2", 2222),
-                ],
-                # An event-loop in pid 2002 on host1. This host has two
-                # configured IP addresses, 1.1.1.1 and 1.1.1.2.
-                "host1:pid=2002": [
-                    ("::ffff:1.1.1.1", 3333),
-                    ("::ffff:1.1.1.2", 4444),
-                ],
-                # An event-loop in pid 3003 on host2. This host has one
-                # configured IP address, 2.2.2.2.
-                "host2:pid=3003": [("::ffff:2.2.2.2", 5555)],
-            }
+    example_rpc_info_view = {
+        "eventloops": {
+            # An event-loop in pid 1001 on host1. This host has two
+            # configured IP addresses, 1.1.1.1 and 1.1.1.2.
+            "host1:pid=1001": [
+                ["::ffff:1.1.1.1", 1111],
+                ["::ffff:1.1.1.2", 2222],
+            ],
+            # An event-loop in pid 2002 on host1. This host has two
+            # configured IP addresses, 1.1.1.1 and 1.1.1.2.
+            "host1:pid=2002": [
+                ["::ffff:1.1.1.1", 3333],
+                ["::ffff:1.1.1.2", 4444],
+            ],
+            # An event-loop in pid 3003 on host2. This host has one
+            # configured IP address, 2.2.2.2.
+            "host2:pid=3003": [["::ffff:2.2.2.2", 5555]],
         }
-    ).encode("ascii")
+    }
+    example_rpc_info_view_response = json.dumps(example_rpc_info_view).encode(
+        "ascii"
+    )
+    # The connections made initially for the view above: the first address
+    # of each event-loop is tried first.
+    example_rpc_info_view_connect_calls = [
+        call("host1:pid=1001", ("::ffff:1.1.1.1", 1111)),
+        call("host1:pid=2002", ("::ffff:1.1.1.1", 3333)),
+        call("host2:pid=3003", ("::ffff:2.2.2.2", 5555)),
+    ]
 
     def test_doUpdate_calls__update_connections(self):
         maas_url = "http://localhost/%s/" % factory.make_name("path")
@@ -741,35 +780,35 @@ class TestClusterClientService(MAASTestCase):
             }
         )
 
-    @inlineCallbacks
     def test_update_connections_initially(self):
-        service = ClusterClientService(Clock())
+        (
+            service,
+            _make_connection,
+            _drop_connection,
+        ) = self.make_service_with_patched_connections()
         mock_client = Mock()
-        _make_connection = self.patch(service.connections, "connect")
         _make_connection.side_effect = lambda *args: succeed(mock_client)
-        _drop_connection = self.patch(service.connections, "disconnect")
 
-        info = json.loads(self.example_rpc_info_view_response.decode("ascii"))
-        yield service._update_connections(info["eventloops"])
+        info = self.example_rpc_info_view
+        d = service._update_connections(info["eventloops"])
 
-        _make_connection_expected = [
-            call("host1:pid=1001", ("::ffff:1.1.1.1", 1111)),
-            call("host1:pid=2002", ("::ffff:1.1.1.1", 3333)),
-            call("host2:pid=3003", ("::ffff:2.2.2.2", 5555)),
-        ]
-        self.assertEqual(
-            _make_connection_expected, _make_connection.call_args_list
-        )
-        self.assertEqual(
-            {
-                "host1:pid=1001": mock_client,
-                "host1:pid=2002": mock_client,
-                "host2:pid=3003": mock_client,
-            },
-            service.connections.try_connections,
-        )
+        def check(_):
+            self.assertEqual(
+                self.example_rpc_info_view_connect_calls,
+                _make_connection.call_args_list,
+            )
+            self.assertEqual(
+                {
+                    "host1:pid=1001": mock_client,
+                    "host1:pid=2002": mock_client,
+                    "host2:pid=3003": mock_client,
+                },
+                service.connections.try_connections,
+            )
+
+            self.assertEqual([], _drop_connection.mock_calls)
 
-        self.assertEqual([], _drop_connection.mock_calls)
+        return d.addCallback(check)
 
     @inlineCallbacks
     def test_update_connections_logs_fully_connected(self):
@@ -798,60 +837,72 @@ class TestClusterClientService(MAASTestCase):
             logger.dump(),
         )
 
-    @inlineCallbacks
     def test_update_connections_connect_error_is_logged_tersely(self):
-        service = ClusterClientService(Clock())
-        _make_connection = self.patch(service.connections, "connect")
+        (
+            service,
+            _make_connection,
+            _,
+        ) = self.make_service_with_patched_connections()
         _make_connection.side_effect = error.ConnectionRefusedError()
 
         logger = self.useFixture(TwistedLoggerFixture())
 
         eventloops = {"an-event-loop": [("127.0.0.1", 1234)]}
-        yield service._update_connections(eventloops)
+        d = service._update_connections(eventloops)
 
-        _make_connection.assert_called_once_with(
-            "an-event-loop", ("::ffff:127.0.0.1", 1234)
-        )
+        def check(_):
+            _make_connection.assert_called_once_with(
+                "an-event-loop", ("::ffff:127.0.0.1", 1234)
+            )
 
-        self.assertEqual(
-            "Making connections to event-loops: an-event-loop\n"
-            "---\n"
-            "Event-loop an-event-loop (::ffff:127.0.0.1:1234): Connection "
-            "was refused by other side.",
-            logger.dump(),
-        )
+            self.assertEqual(
+                "Making connections to event-loops: an-event-loop\n"
+                "---\n"
+                "Event-loop an-event-loop (::ffff:127.0.0.1:1234): Connection "
+                "was refused by other side.",
+                logger.dump(),
+            )
+
+        return d.addCallback(check)
 
-    @inlineCallbacks
     def test_update_connections_unknown_error_is_logged_with_stack(self):
-        service = ClusterClientService(Clock())
-        _make_connection = self.patch(service.connections, "connect")
+        (
+            service,
+            _make_connection,
+            _,
+        ) = self.make_service_with_patched_connections()
         _make_connection.side_effect = RuntimeError("Something went wrong.")
 
         logger = self.useFixture(TwistedLoggerFixture())
 
         eventloops = {"an-event-loop": [("127.0.0.1", 1234)]}
-        yield service._update_connections(eventloops)
+        d = service._update_connections(eventloops)
 
-        _make_connection.assert_called_once_with(
-            "an-event-loop", ("::ffff:127.0.0.1", 1234)
-        )
+        def check(_):
+            _make_connection.assert_called_once_with(
+                "an-event-loop", ("::ffff:127.0.0.1", 1234)
+            )
 
-        self.assertEqual(
-            logger.messages,
-            [
-                "Making connections to event-loops: an-event-loop",
-                "Failure with event-loop an-event-loop (::ffff:127.0.0.1:1234)",
-            ],
-        )
-        failure_messages = [
-            failure.getErrorMessage() for failure in logger.failures
-        ]
-        self.assertEqual(failure_messages, ["Something went wrong."])
+            self.assertEqual(
+                logger.messages,
+                [
+                    "Making connections to event-loops: an-event-loop",
+                    "Failure with event-loop an-event-loop (::ffff:127.0.0.1:1234)",
+                ],
+            )
+            failure_messages = [
+                failure.getErrorMessage() for failure in logger.failures
+            ]
+            self.assertEqual(failure_messages, ["Something went wrong."])
+
+        return d.addCallback(check)
 
     def test_update_connections_when_there_are_existing_connections(self):
-        service = ClusterClientService(Clock())
-        _connect = self.patch(service.connections, "connect")
-        _disconnect = self.patch(service.connections, "disconnect")
+        (
+            service,
+            _connect,
+            _disconnect,
+        ) = self.make_service_with_patched_connections()
 
         host1client = ClusterClient(
             ("::ffff:1.1.1.1", 1111), "host1:pid=1", service
@@ -1029,13 +1080,11 @@ class TestClusterClientService(MAASTestCase):
             sentinel.eventloop02: [FakeConnection()],
             sentinel.eventloop03: [FakeConnection()],
         }
+        client = service.getClient()
+        self.assertIsInstance(client, common.Client)
         self.assertIn(
-            service.getClient(),
-            {
-                common.Client(conn)
-                for conns in service.connections.values()
-                for conn in conns
-            },
+            client._conn,
+            [conn for conns in service.connections.values() for conn in conns],
         )
 
     def test_getClient_when_there_are_no_connections(self):
@@ -1052,13 +1101,10 @@ class TestClusterClientService(MAASTestCase):
         }
         client = service.getClient(busy_ok=True)
         self.assertTrue(client._conn.in_use)
+        self.assertIsInstance(client, common.Client)
         self.assertIn(
-            client,
-            {
-                common.Client(conn)
-                for conns in service.connections.values()
-                for conn in conns
-            },
+            client._conn,
+            [conn for conns in service.connections.values() for conn in conns],
         )
 
     @inlineCallbacks
@@ -1128,13 +1174,10 @@ class TestClusterClientService(MAASTestCase):
             sentinel.eventloop03: [FakeConnection()],
         }
         client = yield service.getClientNow()
+        self.assertIsInstance(client, common.Client)
         self.assertIn(
-            client,
-            [
-                common.Client(conn)
-                for conns in service.connections.values()
-                for conn in conns
-            ],
+            client._conn,
+            [conn for conns in service.connections.values() for conn in conns],
         )
 
     @inlineCallbacks
@@ -1151,13 +1194,10 @@ class TestClusterClientService(MAASTestCase):
 
         self.patch(service, "_tryUpdate").side_effect = addConnections
         client = yield service.getClientNow()
+        self.assertIsInstance(client, common.Client)
         self.assertIn(
-            client,
-            {
-                common.Client(conn)
-                for conns in service.connections.values()
-                for conn in conns
-            },
+            client._conn,
+            [conn for conns in service.connections.values() for conn in conns],
         )
 
     def test_getClientNow_raises_exception_when_no_clients(self):
@@ -1270,7 +1310,7 @@ class TestClusterClientServiceIntervals(MAASTestCase):
         ),
     )
 
-    run_tests_with = MAASTwistedRunTest.make_factory(timeout=TIMEOUT)
+    run_tests_with = twisted_test_factory
 
     def test_calculate_interval(self):
         service = make_inert_client_service()
@@ -1285,27 +1325,37 @@ class TestClusterClientServiceIntervals(MAASTestCase):
 
 
 class TestClusterClient(MAASTestCase):
-    run_tests_with = MAASTwistedRunTest.make_factory(timeout=TIMEOUT)
+    run_tests_with = twisted_test_factory
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # No test depends on the URL's value, so generate it only once.
+        cls.maas_url = factory.make_simple_http_url()
+        # Clients under test all hang off one running, inert service; see
+        # setUp for how it's reset between tests.
+        cls.service = make_inert_client_service()
+        cls.service.startService()
+        cls.addClassCleanup(cls.service.stopService)
 
     def setUp(self):
         super().setUp()
-        self.useFixture(
-            ClusterConfigurationFixture(
-                maas_url=factory.make_simple_http_url(),
-            )
-        )
+        self.useFixture(ClusterConfigurationFixture(maas_url=self.maas_url))
         self.patch(
             clusterservice, "get_all_interfaces_definition"
         ).return_value = {}
+        # Undo whatever the previous test did to the shared service.
+        self.service.running = True
+        self.service.connections.connections.clear()
+        self.service.connections.try_connections.clear()
+        self.service._rpc_info_state = None
 
     def make_running_client(self):
-        client = clusterservice.ClusterClient(
+        return clusterservice.ClusterClient(
             address=("example.com", 1234),
             eventloop="eventloop:pid=12345",
-            service=make_inert_client_service(),
+            service=self.service,
         )
-        client.service.startService()
-        return client
 
     def patch_authenticate_for_success(self, client):
         authenticate = self.patch_autospec(client, "authenticateRegion")
@@ -1331,6 +1381,12 @@ class TestClusterClient(MAASTestCase):
         register = self.patch_autospec(client, "registerRackWithRegion")
         register.side_effect = always_fail_with(exception)
 
+    def connect_with_stub_transport(self, client):
+        # Only connectionMade's branching matters to the callers, so give the
+        # client a stub transport instead of going through makeConnection.
+        client.transport = Mock()
+        client.connectionMade()
+
     def test_interfaces(self):
         client = self.make_running_client()
         # transport.getHandle() is used by AMP._getPeerCertificate, which we
@@ -1371,10 +1427,7 @@ class TestClusterClient(MAASTestCase):
         client = self.make_running_client()
         client.service.running = False
 
-        # Connect via an in-memory transport.
-        transport = StringTransportWithDisconnection()
-        transport.protocol = client
-        client.makeConnection(transport)
+        self.connect_with_stub_transport(client)
 
         # authenticated was set to None to signify that authentication was not
         # attempted.
@@ -1386,17 +1439,14 @@ class TestClusterClient(MAASTestCase):
         # The connections list is unchanged because the new connection
         # immediately disconnects.
         self.assertEqual(client.service.connections, {})
-        self.assertFalse(client.connected)
+        client.transport.loseConnection.assert_called_once_with()
 
     def test_disconnects_when_authentication_fails(self):
         client = self.make_running_client()
         self.patch_authenticate_for_failure(client)
         self.patch_register_for_success(client)
 
-        # Connect via an in-memory transport.
-        transport = StringTransportWithDisconnection()
-        transport.protocol = client
-        client.makeConnection(transport)
+        self.connect_with_stub_transport(client)
 
         # authenticated was set to False.
         self.assertFalse(extract_result(client.authenticated.get()))
@@ -1408,7 +1458,7 @@ class TestClusterClient(MAASTestCase):
         # The connections list is unchanged because the new connection
         # immediately disconnects.
         self.assertEqual(client.service.connections.connections, {})
-        self.assertFalse(client.connected)
+        client.transport.loseConnection.assert_called_once_with()
 
     def test_disconnects_when_authentication_errors(self):
         client = self.make_running_client()
@@ -1418,10 +1468,7 @@ class TestClusterClient(MAASTestCase):
 
         logger = self.useFixture(TwistedLoggerFixture())
 
-        # Connect via an in-memory transport.
-        transport = StringTransportWithDisconnection()
-        transport.protocol = client
-        client.makeConnection(transport)
+        self.connect_with_stub_transport(client)
 
         # authenticated errbacks with the error.
         self.assertRaises(
@@ -1439,17 +1486,14 @@ class TestClusterClient(MAASTestCase):
         # The connections list is unchanged because the new connection
         # immediately disconnects.
         self.assertEqual(client.service.connections, {})
-        self.assertFalse(client.connected)
+        client.transport.loseConnection.assert_called_once_with()
 
     def test_disconnects_when_registration_fails(self):
         client = self.make_running_client()
         self.patch_authenticate_for_success(client)
         self.patch_register_for_failure(client)
 
-        # Connect via an in-memory transport.
-        transport = StringTransportWithDisconnection()
-        transport.protocol = client
-        client.makeConnection(transport)
+        self.connect_with_stub_transport(client)
 
         # authenticated was set to True because it succeeded.
         self.assertTrue(extract_result(client.authenticated.get()))
@@ -1461,7 +1505,7 @@ class TestClusterClient(MAASTestCase):
         # The connections list is unchanged because the new connection
         # immediately disconnects.
         self.assertEqual(client.service.connections, {})
-        self.assertFalse(client.connected)
+        client.transport.loseConnection.assert_called_once_with()
 
     def test_disconnects_when_registration_errors(self):
         client = self.make_running_client()
@@ -1471,10 +1515,7 @@ class TestClusterClient(MAASTestCase):
 
         logger = self.useFixture(TwistedLoggerFixture())
 
-        # Connect via an in-memory transport.
-        transport = StringTransportWithDisconnection()
-        transport.protocol = client
-        client.makeConnection(transport)
+        self.connect_with_stub_transport(client)
 
         # authenticated was set to True because it succeeded.
         self.assertTrue(extract_result(client.authenticated.get()))
@@ -1490,7 +1531,7 @@ class TestClusterClient(MAASTestCase):
         # The connections list is unchanged because the new connection
         # immediately disconnects.
         self.assertEqual(client.service.connections, {})
-        self.assertFalse(client.connected)
+        client.transport.loseConnection.assert_called_once_with()
 
     def test_handshakeFailed_does_not_log_when_connection_is_closed(self):
         client = self.make_running_client()
@@ -1501,41 +1542,39 @@ class TestClusterClient(MAASTestCase):
         # Nothing was logged.
         self.assertEqual("", logger.output)
 
-    @inlineCallbacks
     def test_secureConnection_calls_StartTLS_and_Identify(self):
         client = self.make_running_client()
 
         callRemote = self.patch(client, "callRemote")
-        callRemote_return_values = [
+        callRemote.side_effect = [
             {},  # In response to a StartTLS call.
             {"ident": client.eventloop},  # Identify.
         ]
-        callRemote.side_effect = lambda cmd, **kwargs: (
-            callRemote_return_values.pop(0)
-        )
 
         transport = self.patch(client, "transport")
         logger = self.useFixture(TwistedLoggerFixture())
 
-        yield client.secureConnection()
+        d = client.secureConnection()
 
-        callRemote.assert_has_calls(
-            [
-                call(amp.StartTLS, **client.get_tls_parameters()),
-                call(region.Identify),
-            ]
-        )
+        def check(_):
+            callRemote.assert_has_calls(
+                [
+                    call(amp.StartTLS, **client.get_tls_parameters()),
+                    call(region.Identify),
+                ]
+            )
 
-        # The connection is not dropped.
-        transport.loseConnection.assert_not_called()
+            # The connection is not dropped.
+            transport.loseConnection.assert_not_called()
 
-        # The certificates used are echoed to the log.
-        self.assertEqual(
-            ["Host certificate", "Peer certificate"],
-            [msg.split(":")[0] for msg in logger.messages],
-        )
+            # The certificates used are echoed to the log.
+            self.assertEqual(
+                ["Host certificate", "Peer certificate"],
+                [msg.split(":")[0] for msg in logger.messages],
+            )
+
+        return d.addCallback(check)
 
-    @inlineCallbacks
     def test_secureConnection_disconnects_if_ident_does_not_match(self):
         client = self.make_running_client()
 
@@ -1548,16 +1587,19 @@ class TestClusterClient(MAASTestCase):
         transport = self.patch(client, "transport")
         logger = self.useFixture(TwistedLoggerFixture())
 
-        yield client.secureConnection()
+        d = client.secureConnection()
 
-        # The connection is dropped.
-        transport.loseConnection.assert_called_once_with()
+        def check(_):
+            # The connection is dropped.
+            transport.loseConnection.assert_called_once_with()
 
-        # The log explains why.
-        self.assertEqual(
-            "The remote event-loop identifies itself as bogus-name, but eventloop:pid=12345 was expected.",
-            logger.dump(),
-        )
+            # The log explains why.
+            self.assertEqual(
+                "The remote event-loop identifies itself as bogus-name, but eventloop:pid=12345 was expected.",
+                logger.dump(),
+            )
+
+        return d.addCallback(check)
 
     # XXX: blake_r 2015-02-26 bug=1426089: Failing because of an unknown
     # reason. This is commented out instead of using @skip because of
@@ -1803,7 +1845,7 @@ class TestClusterClient(MAASTestCase):
 
 
 class TestClusterClientCheckerService(MAASTestCase):
-    run_tests_with = MAASTwistedRunTest.make_factory(timeout=TIMEOUT)
+    run_tests_with = twisted_test_factory
 
     def make_client(self):
         client = Mock()
@@ -1856,7 +1898,7 @@ class TestClusterClientCheckerService(MAASTestCase):
 
 
 class TestClusterProtocol_ValidateLicenseKey(MAASTestCase):
-    run_tests_with = MAASTwistedRunTest.make_factory(timeout=TIMEOUT)
+    run_tests_with = twisted_test_factory
 
     def test_is_registered(self):
         protocol = Cluster()
@@ -1905,7 +1947,7 @@ class TestClusterProtocol_ValidateLicenseKey(MAASTestCase):
 
 
 class TestClusterProtocol_PowerOn_PowerOff_PowerCycle(MAASTestCase):
-    run_tests_with = MAASTwistedRunTest.make_factory(timeout=TIMEOUT)
+    run_tests_with = twisted_test_factory
 
     scenarios = (
         (
@@ -2033,7 +2075,7 @@ class TestClusterProtocol_PowerOn_PowerOff_PowerCycle(MAASTestCase):
 
 
 class TestClusterProtocol_PowerQuery(MAASTestCase):
-    run_tests_with = MAASTwistedRunTest.make_factory(timeout=TIMEOUT)
+    run_tests_with = twisted_test_factory
 
     def test_is_registered(self):
         protocol = Cluster()
@@ -2109,7 +2151,7 @@ class TestClusterProtocol_PowerQuery(MAASTestCase):
 
 
 class TestClusterProtocol_SetBootOrder(MAASTestCase):
-    run_tests_with = MAASTwistedRunTest.make_factory(timeout=TIMEOUT)
+    run_tests_with = twisted_test_factory
 
     def test_is_registered(self):
         protocol = Cluster()
@@ -2247,7 +2289,7 @@ class TestClusterProtocol_ConfigureDHCP(MAASTestCase):
         ),
     )
 
-    run_tests_with = MAASTwistedRunTest.make_factory(timeout=TIMEOUT)
+    run_tests_with = twisted_test_factory
 
     assertRaises = TestCase.assertRaises
 
@@ -2408,7 +2450,7 @@ class TestClusterProtocol_ValidateDHCP(MAASTestCase):
         ),
     )
 
-    run_tests_with = MAASTwistedRunTest.make_factory(timeout=TIMEOUT)
+    run_tests_with = twisted_test_factory
 
     def setUp(self):
         super().setUp()
@@ -2507,7 +2549,7 @@ class TestClusterProtocol_ValidateDHCP(MAASTestCase):
 
 
 class TestClusterProtocol_EvaluateTag(MAASTestCase):
-    run_tests_with = MAASTwistedRunTest.make_factory(timeout=TIMEOUT)
+    run_tests_with = twisted_test_factory
 
     def test_is_registered(self):
         protocol = Cluster()
@@ -2604,7 +2646,7 @@ class MAASTestCaseThatWaitsForDeferredThreads(MAASTestCase):
 
     # Subclasses can override this, but they MUST choose a runner that runs
     # the test itself and all clean-up functions in the Twisted reactor.
-    run_tests_with = MAASTwistedRunTest.make_factory(timeout=TIMEOUT)
+    run_tests_with = twisted_test_factory
 
     def setUp(self):
         super().setUp()
@@ -2620,7 +2662,7 @@ class MAASTestCaseThatWaitsForDeferredThreads(MAASTestCase):
 class TestClusterProtocol_ScanNetworks(
     MAASTestCaseThatWaitsForDeferredThreads
 ):
-    run_tests_with = MAASTwistedRunTest.make_factory(timeout=TIMEOUT)
+    run_tests_with = twisted_test_factory
 
     def test_is_registered(self):
         protocol = Cluster()
@@ -2805,7 +2847,7 @@ class TestClusterProtocol_ScanNetworks(
 
 
 class TestClusterProtocol_AddChassis(MAASTestCase):
-    run_tests_with = MAASTwistedRunTest.make_factory(timeout=TIMEOUT)
+    run_tests_with = twisted_test_factory
 
     def test_is_registered(self):
         protocol = Cluster()
@@ -3508,7 +3550,7 @@ class TestClusterProtocol_AddChassis(MAASTestCase):
 
 
 class TestClusterProtocol_DiscoverPodProjects(MAASTestCase):
-    run_tests_with = MAASTwistedRunTest.make_factory(timeout=TIMEOUT)
+    run_tests_with = twisted_test_factory
 
     def test_is_registered(self):
         protocol = Cluster()
@@ -3549,7 +3591,7 @@ class TestClusterProtocol_DiscoverPodProjects(MAASTestCase):
 
 
 class TestClusterProtocol_DiscoverPod(MAASTestCase):
-    run_tests_with = MAASTwistedRunTest.make_factory(timeout=TIMEOUT)
+    run_tests_with = twisted_test_factory
 
     def test_is_registered(self):
         protocol = Cluster()
@@ -3596,7 +3638,7 @@ class TestClusterProtocol_DiscoverPod(MAASTestCase):
 
 
 class TestClusterProtocol_SendPodCommissioningResults(MAASTestCase):
-    run_tests_with = MAASTwistedRunTest.make_factory(timeout=TIMEOUT)
+    run_tests_with = twisted_test_factory
 
     def test_is_registered(self):
         protocol = Cluster()
@@ -3709,7 +3751,7 @@ class TestClusterProtocol_ComposeMachine(MAASTestCase):
 
 
 class TestClusterProtocol_DecomposeMachine(MAASTestCase):
-    run_tests_with = MAASTwistedRunTest.make_factory(timeout=TIMEOUT)
+    run_tests_with = twisted_test_factory
 
     def test_is_registered(self):
         protocol = Cluster()
@@ -3748,7 +3790,7 @@ class TestClusterProtocol_DecomposeMachine(MAASTestCase):
 
 
 class TestClusterProtocol_DisableAndShutoffRackd(MAASTestCase):
-    run_tests_with = MAASTwistedRunTest.make_factory(timeout=TIMEOUT)
+    run_tests_with = twisted_test_factory
 
     assertRaises = TestCase.assertRaises
 
@@ -3826,7 +3868,7 @@ class TestClusterProtocol_DisableAndShutoffRackd(MAASTestCase):
 
 
 class TestClusterProtocol_CheckIPs(MAASTestCaseThatWaitsForDeferredThreads):
-    run_tests_with = MAASTwistedRunTest.make_factory(timeout=TIMEOUT)
+    run_tests_with = twisted_test_factory
 
     def test_is_registered(self):
         protocol = Cluster()
@@ -7,6 +7,8 @@
 from binascii import b2a_hex
 from pathlib import Path
 from random import randint
+import shutil
+import tempfile
 import time
 from unittest.mock import sentinel
 
@@ -40,15 +42,25 @@ class SharedSecretTestCase(MAASTestCase):
 
 
 class TestInstallSharedSecretScript(MAASTestCase):
+    # A known secret keeps these round-trip tests deterministic.
+    secret = bytes(range(0, 256, 17))
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Tests only need somewhere private to write the shared secret, so
+        # share one directory between them.
+        cls.tempdir = Path(tempfile.mkdtemp())
+        cls.addClassCleanup(shutil.rmtree, cls.tempdir)
+
     def setUp(self):
-        # Ensure each test uses a different filename for the shared secret,
-        # so that tests cannot interfere with each other.
         super().setUp()
-        tempdir = Path(self.make_dir())
+        # Remove the shared secret after each test so that tests cannot
+        # interfere with each other.
+        secret_path = self.tempdir / "secret"
+        self.addCleanup(secret_path.unlink, missing_ok=True)
         utils_env.MAAS_SHARED_SECRET.clear_cached()
-        self.patch(
-            utils_env.MAAS_SHARED_SECRET, "_path", lambda: tempdir / "secret"
-        )
+        self.patch(utils_env.MAAS_SHARED_SECRET, "_path", lambda: secret_path)
         self._mock_print = self.patch(security, "print")
 
     def read_secret_from_fs(self):
@@ -68,51 +80,43 @@ class TestInstallSharedSecretScript(MAASTestCase):
         self.assertEqual(code, error.code)
 
     def test_reads_secret_from_stdin(self):
-        secret = factory.make_bytes()
-
         stdin = self.patch_autospec(security, "stdin")
-        stdin.readline.return_value = b2a_hex(secret).decode("ascii")
+        stdin.readline.return_value = b2a_hex(self.secret).decode("ascii")
         stdin.isatty.return_value = False
 
         self.installAndCheckExitCode(0)
-        self.assertEqual(self.read_secret_from_fs(), secret)
+        self.assertEqual(self.read_secret_from_fs(), self.secret)
 
     def test_ignores_surrounding_whitespace_from_stdin(self):
-        secret = factory.make_bytes()
-
         stdin = self.patch_autospec(security, "stdin")
         stdin.readline.return_value = (
-            " " + b2a_hex(secret).decode("ascii") + " \n"
+            " " + b2a_hex(self.secret).decode("ascii") + " \n"
         )
         stdin.isatty.return_value = False
 
         self.installAndCheckExitCode(0)
-        self.assertEqual(self.read_secret_from_fs(), secret)
+        self.assertEqual(self.read_secret_from_fs(), self.secret)
 
     def test_reads_secret_from_tty(self):
-        secret = factory.make_bytes()
-
         stdin = self.patch_autospec(security, "stdin")
         stdin.isatty.return_value = True
 
         input = self.patch(security, "input")
-        input.return_value = b2a_hex(secret).decode("ascii")
+        input.return_value = b2a_hex(self.secret).decode("ascii")
 
         self.installAndCheckExitCode(0)
         input.assert_called_once_with("Secret (hex/base16 encoded): ")
-        self.assertEqual(self.read_secret_from_fs(), secret)
+        self.assertEqual(self.read_secret_from_fs(), self.secret)
 
     def test_ignores_surrounding_whitespace_from_tty(self):
-        secret = factory.make_bytes()
-
         stdin = self.patch_autospec(security, "stdin")
         stdin.isatty.return_value = True
 
         input = self.patch(security, "input")
-        input.return_value = " " + b2a_hex(secret).decode("ascii") + " \n"
+        input.return_value = " " + b2a_hex(self.secret).decode("ascii") + " \n"
 
         self.installAndCheckExitCode(0)
-        self.assertEqual(self.read_secret_from_fs(), secret)
+        self.assertEqual(self.read_secret_from_fs(), self.secret)
 
     def test_deals_gracefully_with_eof_from_tty(self):
         stdin = self.patch_autospec(security, "stdin")
@@ -152,9 +156,7 @@ class TestInstallSharedSecretScript(MAASTestCase):
 
     def test_prints_message_when_secret_is_installed(self):
         stdin = self.patch_autospec(security, "stdin")
-        stdin.readline.return_value = b2a_hex(factory.make_bytes()).decode(
-            "ascii"
-        )
+        stdin.readline.return_value = b2a_hex(self.secret).decode("ascii")
         stdin.isatty.return_value = False
 
         self.installAndCheckExitCode(0)
@@ -7,6 +7,7 @@ from functools import lru_cache
 import json
 import os
 from pathlib import Path
+import re
 
 import netifaces
 
@@ -16,6 +17,12 @@ from provisioningserver.utils.lxd import parse_lxd_networks
 from provisioningserver.utils.shell import call_and_check
 from provisioningserver.utils.snap import running_in_snap, SnapPaths
 
+# The fields of /proc/net/bonding/<interface> used to find bond members'
+# original MAC addresses.
+_PROC_NET_BONDING_FIELD_RE = re.compile(
+    r"^(Slave Interface|Permanent HW addr): (.*)$"
+)
+
 
 def get_ip_addr():
     """Returns this system's local IP address information as a dictionary.
@@ -95,19 +102,26 @@ def _update_interface_type(interfaces, sys_class_net=Path("/sys/class/net")):
             return iftype
 
         sys_path = sys_class_net / name
-        if not sys_path.is_dir():
+        # List the interface's directory once rather than probing each of
+        # the entries below with a separate stat call.
+        try:
+            with os.scandir(sys_path) as it:
+                entries = {entry.name: entry for entry in it}
+        except (FileNotFoundError, NotADirectoryError):
             return "missing"
 
-        iftype_id = int((sys_path / "type").read_text())
+        # int() parses the raw bytes, so there's no need for a text decoder.
+        iftype_id = int((sys_path / "type").read_bytes())
         # The iftype value here is defined in linux/if_arp.h.
         # The important thing here is that Ethernet maps to 1.
         # Currently, MAAS only runs on Ethernet interfaces.
         if iftype_id == 1:
-            if (sys_path / "tun_flags").is_file():
+            tun_flags = entries.get("tun_flags")
+            if tun_flags is not None and tun_flags.is_file():
                 return "tunnel"
-            device_path = sys_path / "device"
-            if device_path.is_symlink():
-                if (device_path / "ieee80211").is_dir():
+            device = entries.get("device")
+            if device is not None and device.is_symlink():
+                if (sys_path / "device" / "ieee80211").is_dir():
                     return "wireless"
                 else:
                     return "physical"
@@ -159,14 +173,15 @@ def _parse_proc_net_bonding(path):
     interfaces = {}
     current_iface = None
     with open(path) as fd:
-        for line in fd.readlines():
-            line = line.strip()
-            slave_iface = line.split("Slave Interface: ")
-            if len(slave_iface) == 2:
-                current_iface = slave_iface[1]
-            hw_addr = line.split("Permanent HW addr: ")
-            if len(hw_addr) == 2:
-                interfaces[current_iface] = hw_addr[1]
+        for line in fd:
+            match = _PROC_NET_BONDING_FIELD_RE.match(line.strip())
+            if match is None:
+                continue
+            field, value = match.groups()
+            if field == "Slave Interface":
+                current_iface = value
+            else:
+                interfaces[current_iface] = value
     return interfaces
 
 
@@ -22,6 +22,50 @@ from provisioningserver.utils.ipaddr import (
 )
 from provisioningserver.utils.tests.test_lxd import SAMPLE_LXD_NETWORKS
 
+# Sample /proc/net/bonding/<interface> content for an active-backup bond.
+PROC_NET_BONDING_BOND0 = dedent(
+    """\
+    Ethernet Channel Bonding Driver: v3.7.1 (April 27, 2011)
+
+    Bonding Mode: fault-tolerance (active-backup)
+    Primary Slave: None
+    Currently Active Slave: ens11
+    MII Status: up
+    MII Polling Interval (ms): 100
+    Up Delay (ms): 200
+    Down Delay (ms): 0
+
+    Slave Interface: ens11
+    MII Status: up
+    Speed: Unknown
+    Duplex: Unknown
+    Link Failure Count: 0
+    Permanent HW addr: 52:54:00:ea:1c:fc
+    Slave queue ID: 0
+
+    Slave Interface: ens3
+    MII Status: up
+    Speed: Unknown
+    Duplex: Unknown
+    Link Failure Count: 0
+    Permanent HW addr: 52:54:00:13:0e:6f
+    Slave queue ID: 0
+    """
+)
+
+# A single interface as LXD reports it before its type is refined from /sys.
+BROADCAST_LXD_NETWORKS = {
+    "if0": {
+        "addresses": [],
+        "hwaddr": "00:00:00:00:00:01",
+        "state": "up",
+        "type": "broadcast",
+        "bond": None,
+        "bridge": None,
+        "vlan": None,
+    },
+}
+
 
 class FakeSysProcTestCase(MAASTestCase):
     def setUp(self):
@@ -60,37 +104,8 @@ class FakeSysProcTestCase(MAASTestCase):
 
 class TestAnnotateWithProcNetBondingOriginalMacs(FakeSysProcTestCase):
     def test_finds_bond_members_original_mac_addresses(self):
-        testdata = dedent(
-            """\
-            Ethernet Channel Bonding Driver: v3.7.1 (April 27, 2011)
-
-            Bonding Mode: fault-tolerance (active-backup)
-            Primary Slave: None
-            Currently Active Slave: ens11
-            MII Status: up
-            MII Polling Interval (ms): 100
-            Up Delay (ms): 200
-            Down Delay (ms): 0
-
-            Slave Interface: ens11
-            MII Status: up
-            Speed: Unknown
-            Duplex: Unknown
-            Link Failure Count: 0
-            Permanent HW addr: 52:54:00:ea:1c:fc
-            Slave queue ID: 0
-
-            Slave Interface: ens3
-            MII Status: up
-            Speed: Unknown
-            Duplex: Unknown
-            Link Failure Count: 0
-            Permanent HW addr: 52:54:00:13:0e:6f
-            Slave queue ID: 0
-            """
-        )
         proc_net_bonding_bond0 = self.path_proc_net / "bonding" / "bond0"
-        proc_net_bonding_bond0.write_text(testdata)
+        proc_net_bonding_bond0.write_text(PROC_NET_BONDING_BOND0)
         interfaces = {
             "ens3": {"mac": "00:01:02:03:04:05"},
             "ens11": {"mac": "01:02:03:04:05:06"},
@@ -196,107 +211,46 @@ class TestGetIPAddr(MAASTestCase):
 
 class TestUpdateInterfaceType(FakeSysProcTestCase):
     def test_ipip(self):
-        networks = {
-            "if0": {
-                "addresses": [],
-                "hwaddr": "00:00:00:00:00:01",
-                "state": "up",
-                "type": "broadcast",
-                "bond": None,
-                "bridge": None,
-                "vlan": None,
-            },
-        }
         self.createInterfaceType("if0", 768)
-        ifaces = ipaddr_module.parse_lxd_networks(networks)
+        ifaces = ipaddr_module.parse_lxd_networks(BROADCAST_LXD_NETWORKS)
         _update_interface_type(ifaces, sys_class_net=self.path_sys_net)
         self.assertEqual(ifaces["if0"]["type"], "ipip")
 
     def test_tunnel(self):
-        networks = {
-            "if0": {
-                "addresses": [],
-                "hwaddr": "00:00:00:00:00:01",
-                "state": "up",
-                "type": "broadcast",
-                "bond": None,
-                "bridge": None,
-                "vlan": None,
-            },
-        }
         self.createInterfaceType("if0", is_tunnel=True)
-        ifaces = ipaddr_module.parse_lxd_networks(networks)
+        ifaces = ipaddr_module.parse_lxd_networks(BROADCAST_LXD_NETWORKS)
         _update_interface_type(ifaces, sys_class_net=self.path_sys_net)
         self.assertEqual(ifaces["if0"]["type"], "tunnel")
 
     def test_physical(self):
-        networks = {
-            "if0": {
-                "addresses": [],
-                "hwaddr": "00:00:00:00:00:01",
-                "state": "up",
-                "type": "broadcast",
-                "bond": None,
-                "bridge": None,
-                "vlan": None,
-            },
-        }
         self.createInterfaceType("if0", is_physical=True)
-        ifaces = ipaddr_module.parse_lxd_networks(networks)
+        ifaces = ipaddr_module.parse_lxd_networks(BROADCAST_LXD_NETWORKS)
         _update_interface_type(ifaces, sys_class_net=self.path_sys_net)
         self.assertEqual(ifaces["if0"]["type"], "physical")
 
     def test_wireless(self):
-        networks = {
-            "if0": {
-                "addresses": [],
-                "hwaddr": "00:00:00:00:00:01",
-                "state": "up",
-                "type": "broadcast",
-                "bond": None,
-                "bridge": None,
-                "vlan": None,
-            },
-        }
         self.createInterfaceType("if0", is_wireless=True)
-        ifaces = ipaddr_module.parse_lxd_networks(networks)
+        ifaces = ipaddr_module.parse_lxd_networks(BROADCAST_LXD_NETWORKS)
         _update_interface_type(ifaces, sys_class_net=self.path_sys_net)
         self.assertEqual(ifaces["if0"]["type"], "wireless")
 
     def test_ethernet(self):
-        networks = {
-            "if0": {
-                "addresses": [],
-                "hwaddr": "00:00:00:00:00:01",
-                "state": "up",
-                "type": "broadcast",
-                "bond": None,
-                "bridge": None,
-                "vlan": None,
-            },
-        }
         self.createInterfaceType("if0")
-        ifaces = ipaddr_module.parse_lxd_networks(networks)
+        ifaces = ipaddr_module.parse_lxd_networks(BROADCAST_LXD_NETWORKS)
         _update_interface_type(ifaces, sys_class_net=self.path_sys_net)
         self.assertEqual(ifaces["if0"]["type"], "ethernet")
 
     def test_unknown(self):
-        networks = {
-            "if0": {
-                "addresses": [],
-                "hwaddr": "00:00:00:00:00:01",
-                "state": "up",
-                "type": "broadcast",
-                "bond": None,
-                "bridge": None,
-                "vlan": None,
-            },
-        }
         self.createInterfaceType("if0", 123456)
-        ifaces = ipaddr_module.parse_lxd_networks(networks)
+        ifaces = ipaddr_module.parse_lxd_networks(BROADCAST_LXD_NETWORKS)
         _update_interface_type(ifaces, sys_class_net=self.path_sys_net)
         self.assertEqual(ifaces["if0"]["type"], "unknown-123456")
 
+    def test_missing(self):
+        ifaces = ipaddr_module.parse_lxd_networks(BROADCAST_LXD_NETWORKS)
+        _update_interface_type(ifaces, sys_class_net=self.path_sys_net)
+        self.assertEqual(ifaces["if0"]["type"], "missing")
+
 
 class TestGetMachineDefaultGatewayIP(MAASTestCase):
     def test_get_machine_default_gateway_ip_no_defaults(self):
@@ -1,3 +1,6 @@
+import asyncio
+from typing import Iterator
+
 import pytest
 
 from .fixtures.app import (
@@ -8,6 +11,7 @@ from .fixtures.app import (
     user_session_id,
 )
 from .fixtures.db import (
+    database_cache,
     db,
     db_connection,
     fixture,
@@ -21,6 +25,7 @@ __all__ = [
     "authenticated_api_client",
     "authenticated_user",
     "test_config",
+    "database_cache",
     "db",
     "db_connection",
     "fixture",
@@ -29,6 +34,17 @@ __all__ = [
 ]
 
 
+@pytest.fixture(scope="session")
+def event_loop() -> Iterator[asyncio.AbstractEventLoop]:
+    """Run all tests in one event loop so database connections can be reused.
+
+    This overrides the function-scoped loop from pytest-asyncio.
+    """
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
 def pytest_addoption(parser: pytest.Parser) -> None:
     parser.addoption(
         "--sqlalchemy-debug",
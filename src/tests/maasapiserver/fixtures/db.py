@@ -1,10 +1,12 @@
 from contextlib import asynccontextmanager
+from functools import lru_cache
 from os.path import abspath
 import random
 import string
 from typing import Any, AsyncIterator, Iterator
 
 import pytest
+from sqlalchemy import Insert, Select
 from sqlalchemy.ext.asyncio import AsyncConnection
 from sqlalchemy.sql.operators import ColumnOperators
 
@@ -27,13 +29,33 @@ def test_config(
     )
 
 
+@pytest.fixture(scope="package")
+async def database_cache() -> AsyncIterator[dict[tuple[str, bool], Database]]:
+    """Databases shared by the package's tests, keyed on DSN and query echoing.
+
+    Pools are disposed when the package finishes, so no idle connection is
+    left to block tests elsewhere that drop the database.
+    """
+    databases: dict[tuple[str, bool], Database] = {}
+    yield databases
+    for db in databases.values():
+        await db.engine.dispose()
+
+
 @pytest.fixture
-async def db(
-    request: pytest.FixtureRequest, test_config: Config
+def db(
+    request: pytest.FixtureRequest,
+    test_config: Config,
+    database_cache: dict[tuple[str, bool], Database],
 ) -> Iterator[Database]:
-    db = Database(test_config.db, echo=test_config.debug_queries)
+    key = (str(test_config.db.dsn), test_config.debug_queries)
+    db = database_cache.get(key)
+    if db is None:
+        db = Database(test_config.db, echo=test_config.debug_queries)
+        database_cache[key] = db
+    # Tests share the session's event loop (see event_loop in conftest), so
+    # pooled connections are kept for the next test rather than reopened.
     yield db
-    await db.engine.dispose()
 
 
 @pytest.fixture
@@ -81,9 +103,26 @@ async def db_connection(
             await conn.close()
 
 
+@lru_cache(maxsize=None)
+def _insert_statement(table: str) -> Insert:
+    return METADATA.tables[table].insert().returning("*")
+
+
+@lru_cache(maxsize=None)
+def _select_statement(table: str) -> Select:
+    table_cls = METADATA.tables[table]
+    return table_cls.select().order_by(table_cls.c.id)
+
+
 class Fixture:
     """Helper for creating test fixtures."""
 
+    # Maps every byte value onto an ASCII letter, for random_string.
+    _LETTERS_TABLE = bytes(
+        string.ascii_letters.encode("ascii")[i % len(string.ascii_letters)]
+        for i in range(256)
+    )
+
     def __init__(self, conn: AsyncConnection):
         self.conn = conn
 
@@ -92,10 +131,8 @@ class Fixture:
         table: str,
         data: dict[str, Any] | list[dict[str, Any]] | None = None,
     ) -> list[dict[str, Any]]:
-        result = await self.conn.execute(
-            METADATA.tables[table].insert().returning("*"), data
-        )
-        return [row._asdict() for row in result]
+        result = await self.conn.execute(_insert_statement(table), data)
+        return [dict(row) for row in result.mappings()]
 
     async def get(
         self,
@@ -103,16 +140,17 @@ class Fixture:
         *filters: ColumnOperators,
     ) -> list[dict[str, Any]]:
         """Take a peak what is in there"""
-        table_cls = METADATA.tables[table]
         result = await self.conn.execute(
-            table_cls.select()
-            .where(*filters)  # type: ignore[arg-type]
-            .order_by(table_cls.c.id)
+            _select_statement(table).where(*filters)  # type: ignore[arg-type]
         )
-        return [row._asdict() for row in result]
+        return [dict(row) for row in result.mappings()]
 
     def random_string(self, length: int = 10) -> str:
-        return "".join(random.choices(string.ascii_letters, k=length))
+        return (
+            random.randbytes(length)
+            .translate(self._LETTERS_TABLE)
+            .decode("ascii")
+        )
 
 
 @pytest.fixture
@@ -2,11 +2,13 @@ from datetime import timedelta
 import random
 
 import pytest
+import tempita
 
 from maasserver.models import ControllerInfo, Script, VersionedTextFile
 from maasserver.utils.orm import reload_object
 from metadataserver.builtin_scripts import (
     BUILTIN_SCRIPTS,
+    BuiltinScript,
     load_builtin_scripts,
 )
 from metadataserver.enum import SCRIPT_TYPE_CHOICES
@@ -20,6 +22,23 @@ def controller(factory):
     yield controller
 
 
+class TestBuiltinScript:
+    def test_content_injects_file(self):
+        script = BuiltinScript(
+            name="internet-connectivity",
+            filename="internet-connectivity.sh",
+            inject_file="base-connectivity.sh",
+        )
+        assert script.inject_path.read_text() in script.content
+        assert "inject_file" not in script.substitutes
+
+    def test_content_is_rendered_once(self, mocker):
+        from_filename = mocker.spy(tempita.Template, "from_filename")
+        script = BuiltinScript(name="ntp", filename="ntp.sh")
+        assert script.content == script.content
+        from_filename.assert_called_once()
+
+
 @pytest.mark.usefixtures("maasdb")
 class TestBuiltinScripts:
     def test_creates_scripts(self, controller):